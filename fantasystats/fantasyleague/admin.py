@@ -23,6 +23,8 @@ class TeamsAdmin(admin.ModelAdmin):
     list_display = ['team_id', 'team_name', 'user_id']
     search_fields = ['team_name']
     list_filter = ['user_id']
+    # Maintained from the team's rankings, see TeamsQuerySet.refresh_ranking_stats()
+    readonly_fields = ['total_wins', 'total_losses', 'championships', 'seasons_played', 'best_rank']
 
 
 @admin.register(NFLTeam)
@@ -38,15 +40,25 @@ class NFLTeamStatsAdmin(admin.ModelAdmin):
     list_filter = ['season', 'nfl_team']
     search_fields = ['nfl_team__name']
     ordering = ['-season', 'nfl_team']
+    list_select_related = ['nfl_team']
 
 
 @admin.register(Matchup)
 class MatchupAdmin(admin.ModelAdmin):
-    list_display = ['season', 'week', 'team1', 'team2', 'team1_score', 'team2_score', 'match_date', 'is_playoff', 'is_championship']
+    list_display = ['season', 'week', 'team1', 'team2', 'team1_score', 'team2_score', 'winner', 'match_date', 'is_playoff', 'is_championship']
     list_filter = ['season', 'week', 'is_playoff', 'is_championship']
     search_fields = ['team1__team_name', 'team2__team_name']
     ordering = ['-season', '-week']
     date_hierarchy = 'match_date'
+    list_select_related = ['team1', 'team2']
+    autocomplete_fields = ['team1', 'team2']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_winner()
+    
+    @admin.display(description='Winner')
+    def winner(self, obj):
+        return obj.winner() or 'Tie'
 
 
 @admin.register(PlayerScore)
@@ -56,6 +68,7 @@ class PlayerScoreAdmin(admin.ModelAdmin):
     search_fields = ['player_name', 'team__team_name']
     ordering = ['-fantasy_points']
     raw_id_fields = ['matchup', 'team', 'nfl_team']
+    list_select_related = ['team', 'nfl_team', 'matchup__team1', 'matchup__team2']
 
 
 @admin.register(TeamRanking)
@@ -64,4 +77,5 @@ class TeamRankingAdmin(admin.ModelAdmin):
     list_filter = ['season', 'playoff_appearance', 'championship']
     search_fields = ['team__team_name']
     ordering = ['-season', 'rank']
+    list_select_related = ['team']
     list_editable = ['rank', 'wins', 'losses', 'ties']
@@ -0,0 +1,18 @@
+from .sleeper_api import begin_request_cache, end_request_cache
+
+
+class SleeperRequestCacheMiddleware:
+    """
+    Give each request its own memo of Sleeper API responses so repeated lookups
+    (e.g. get_team_by_roster_id -> get_league_teams) reuse the same data.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = begin_request_cache()
+        try:
+            return self.get_response(request)
+        finally:
+            end_request_cache(token)
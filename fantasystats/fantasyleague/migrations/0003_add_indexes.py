@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-15 04:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasyleague', '0002_matchup_nflteam_playerscore_teamranking_nflteamstats'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='nflteamstats',
+            name='season',
+            field=models.IntegerField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='teams',
+            name='user_id',
+            field=models.IntegerField(db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name='matchup',
+            index=models.Index(fields=['-season', '-week'], name='fantasyleag_season_7f889a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='matchup',
+            index=models.Index(fields=['season', 'is_playoff'], name='fantasyleag_season_7ad67c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playerscore',
+            index=models.Index(fields=['-fantasy_points'], name='fantasyleag_fantasy_a91fc3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playerscore',
+            index=models.Index(fields=['position', 'nfl_team'], name='fantasyleag_positio_bafe1a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teamranking',
+            index=models.Index(fields=['-season', 'rank'], name='fantasyleag_season_f05383_idx'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 4.2.30 on 2026-10-15 04:10
+
+import json
+
+from django.db import migrations, models
+
+
+def _to_json(value, empty):
+    """Convert a legacy text value into a JSON document: keep valid JSON, split comma separated lists."""
+    if not value:
+        return json.dumps(empty)
+    try:
+        json.loads(value)
+        return value
+    except ValueError:
+        if isinstance(empty, list):
+            return json.dumps([item.strip() for item in value.split(',') if item.strip()])
+        return json.dumps(value)
+
+
+def convert_text_to_json(apps, schema_editor):
+    League = apps.get_model('fantasyleague', 'League')
+    Teams = apps.get_model('fantasyleague', 'Teams')
+    for league in League.objects.all():
+        league.roster_positions = _to_json(league.roster_positions, [])
+        league.scoring_settings = _to_json(league.scoring_settings, {})
+        league.divisions = _to_json(league.divisions, [])
+        league.save(update_fields=['roster_positions', 'scoring_settings', 'divisions'])
+    for team in Teams.objects.all():
+        team.roster = _to_json(team.roster, [])
+        team.save(update_fields=['roster'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasyleague', '0003_add_indexes'),
+    ]
+
+    operations = [
+        # Widen the columns first: the JSON form of a comma separated value is
+        # longer than the text, so it may not fit in max_length=200
+        migrations.AlterField(
+            model_name='league',
+            name='divisions',
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name='league',
+            name='roster_positions',
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name='league',
+            name='scoring_settings',
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name='teams',
+            name='roster',
+            field=models.TextField(),
+        ),
+        migrations.RunPython(convert_text_to_json, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='league',
+            name='divisions',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AlterField(
+            model_name='league',
+            name='roster_positions',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AlterField(
+            model_name='league',
+            name='scoring_settings',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AlterField(
+            model_name='teams',
+            name='roster',
+            field=models.JSONField(default=list),
+        ),
+    ]
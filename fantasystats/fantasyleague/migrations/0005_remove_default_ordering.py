@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-15 04:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasyleague', '0004_json_roster_and_settings'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='matchup',
+            options={'verbose_name': 'Matchup', 'verbose_name_plural': 'Matchups'},
+        ),
+        migrations.AlterModelOptions(
+            name='nflteamstats',
+            options={'verbose_name': 'NFL Team Stat', 'verbose_name_plural': 'NFL Team Stats'},
+        ),
+        migrations.AlterModelOptions(
+            name='playerscore',
+            options={'verbose_name': 'Player Score', 'verbose_name_plural': 'Player Scores'},
+        ),
+        migrations.AlterModelOptions(
+            name='teamranking',
+            options={'verbose_name': 'Team Ranking', 'verbose_name_plural': 'Team Rankings'},
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 04:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasyleague', '0005_remove_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='matchup',
+            index=models.Index(fields=['team1', '-season', '-week'], name='fantasyleag_team1_i_2bbbb0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='matchup',
+            index=models.Index(fields=['team2', '-season', '-week'], name='fantasyleag_team2_i_b674e3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playerscore',
+            index=models.Index(fields=['team', '-fantasy_points'], name='fantasyleag_team_id_f2f70d_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.30 on 2026-10-15 04:20
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def populate_ranking_stats(apps, schema_editor):
+    """Fill in the new totals for existing teams, same as TeamsQuerySet.refresh_ranking_stats()."""
+    Teams = apps.get_model('fantasyleague', 'Teams')
+    TeamRanking = apps.get_model('fantasyleague', 'TeamRanking')
+    
+    def ranking_stat(aggregate):
+        rankings = TeamRanking.objects.filter(team=models.OuterRef('pk')).values('team')
+        return Coalesce(models.Subquery(rankings.annotate(value=aggregate).values('value')), 0)
+    
+    Teams.objects.update(
+        total_wins=ranking_stat(models.Sum('wins')),
+        total_losses=ranking_stat(models.Sum('losses')),
+        championships=ranking_stat(models.Count('id', filter=models.Q(championship=True))),
+        seasons_played=ranking_stat(models.Count('id')),
+        best_rank=ranking_stat(models.Min('rank')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fantasyleague', '0006_add_team_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teams',
+            name='best_rank',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='teams',
+            name='championships',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='teams',
+            name='seasons_played',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='teams',
+            name='total_losses',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='teams',
+            name='total_wins',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(populate_ranking_stats, migrations.RunPython.noop),
+    ]
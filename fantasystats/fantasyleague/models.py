@@ -1,13 +1,16 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import GreaterThan
 
 
 class League(models.Model):
     id = models.IntegerField(primary_key=True)
-    roster_positions = models.CharField(max_length=200)
+    roster_positions = models.JSONField(default=list)
     draft_id = models.IntegerField()
-    scoring_settings = models.CharField(max_length=200)
+    scoring_settings = models.JSONField(default=dict)
     season = models.IntegerField()
-    divisions = models.CharField(max_length=200)
+    divisions = models.JSONField(default=list)
 
 
 class User(models.Model):
@@ -19,11 +22,153 @@ class User(models.Model):
 
 
 
+# Team rows rarely change, so team pages can read them from the cache (see Teams.get_cached)
+TEAM_CACHE_TTL = 300
+
+
+class TeamsQuerySet(models.QuerySet):
+    def refresh_ranking_stats(self):
+        """
+        Recalculate the denormalized ranking totals for every team in a single UPDATE.
+        
+        TeamRanking save()/delete() keep them in sync (see signals.py); use this after
+        bulk_create()/bulk_update()/update() on TeamRanking, which bypass the signals.
+        """
+        def ranking_stat(aggregate):
+            rankings = TeamRanking.objects.filter(team=models.OuterRef('pk')).values('team')
+            return Coalesce(models.Subquery(rankings.annotate(value=aggregate).values('value')), 0)
+        
+        return self.update(
+            total_wins=ranking_stat(models.Sum('wins')),
+            total_losses=ranking_stat(models.Sum('losses')),
+            championships=ranking_stat(models.Count('id', filter=models.Q(championship=True))),
+            seasons_played=ranking_stat(models.Count('id')),
+            best_rank=ranking_stat(models.Min('rank')),
+        )
+
+
 class Teams(models.Model):
     team_name = models.CharField(max_length=200)
     team_id = models.IntegerField(primary_key=True)
-    user_id = models.IntegerField()
-    roster = models.CharField(max_length=200)
+    user_id = models.IntegerField(db_index=True)
+    roster = models.JSONField(default=list)
+    # Totals over this team's rankings, denormalized so team_list doesn't aggregate per request
+    total_wins = models.IntegerField(default=0)
+    total_losses = models.IntegerField(default=0)
+    championships = models.IntegerField(default=0)
+    seasons_played = models.IntegerField(default=0)
+    best_rank = models.IntegerField(default=0)
+    
+    # Written by TeamsQuerySet.refresh_ranking_stats(), not by ordinary saves
+    RANKING_STAT_FIELDS = ('total_wins', 'total_losses', 'championships', 'seasons_played', 'best_rank')
+    
+    objects = TeamsQuerySet.as_manager()
+    
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # An instance loaded before its rankings changed holds stale totals, so a plain save()
+        # of an existing row leaves them alone; name them in update_fields to write them anyway
+        if update_fields is None:
+            values = [value for value in values if value[0].name not in self.RANKING_STAT_FIELDS]
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+    
+    @staticmethod
+    def cache_key(pk):
+        return f"fantasyleague:team:{pk}"
+    
+    @classmethod
+    def get_cached(cls, pk):
+        """
+        Return the team with primary key `pk`, cached for TEAM_CACHE_TTL seconds.
+        
+        Raises Teams.DoesNotExist like objects.get(); signals.py drops the cached
+        copy whenever the team or its rankings change.
+        """
+        key = cls.cache_key(pk)
+        team = cache.get(key)
+        if team is None:
+            team = cls.objects.get(pk=pk)
+            cache.set(key, team, TEAM_CACHE_TTL)
+        return team
+
+
+class ChangedFieldsSaveMixin:
+    """
+    Remember the values a row was loaded with, so save() on an existing row
+    only writes the columns that changed and skips the UPDATE when none did.
+    
+    If the row has been deleted since it was loaded, save() inserts it again
+    like a plain Model.save() would.
+    """
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+    
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        # The values just read are the database row that changed_fields() compares against
+        self._loaded_values = getattr(self, '_loaded_values', {})
+        self._loaded_values[self._meta.pk.attname] = self.pk
+        self._loaded_values.update({
+            f.attname: getattr(self, f.attname) for f in self._loaded_fields()
+            if fields is None or f.name in fields or f.attname in fields
+        })
+    
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # Limit the UPDATE to the changed columns picked in save()
+        update_only = getattr(self, '_update_only', None)
+        if update_only is not None:
+            values = [value for value in values if value[0].attname in update_only]
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+    
+    def _loaded_fields(self):
+        deferred = self.get_deferred_fields()
+        return [f for f in self._meta.concrete_fields if not f.primary_key and f.attname not in deferred]
+    
+    def changed_fields(self):
+        """Return the names of loaded fields whose value differs from the database row"""
+        loaded = getattr(self, '_loaded_values', {})
+        return [
+            f.name for f in self._loaded_fields()
+            if f.attname not in loaded or loaded[f.attname] != getattr(self, f.attname)
+        ]
+    
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_values', None)
+        partial = (
+            not args
+            and not self._state.adding
+            # Only for the row that was loaded; a cleared or changed pk means save() inserts a copy
+            and loaded is not None
+            and self.pk is not None
+            and loaded.get(self._meta.pk.attname) == self.pk
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+            and kwargs.get('using', self._state.db) == self._state.db
+        )
+        if partial:
+            changed = self.changed_fields()
+            if not changed:
+                # Nothing to write, as long as the row is still there
+                if type(self)._base_manager.using(self._state.db).filter(pk=self.pk).exists():
+                    return
+            # Not passed as update_fields: when the UPDATE matches no row (it was deleted
+            # since it was loaded), Model.save() still falls back to an INSERT of every field
+            self._update_only = {self._meta.get_field(name).attname for name in changed}
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            self._update_only = None
+        
+        saved = kwargs.get('update_fields')
+        self._loaded_values = getattr(self, '_loaded_values', {})
+        self._loaded_values[self._meta.pk.attname] = self.pk
+        self._loaded_values.update({
+            f.attname: getattr(self, f.attname) for f in self._loaded_fields()
+            if saved is None or f.name in saved or f.attname in saved
+        })
 
 
 class NFLTeam(models.Model):
@@ -43,10 +188,28 @@ class NFLTeam(models.Model):
         return f"{self.city} {self.name}"
 
 
-class NFLTeamStats(models.Model):
+class NFLTeamStatsQuerySet(models.QuerySet):
+    def recompute_averages(self, season=None):
+        """
+        Recalculate average_points for every row (optionally one season) in a single UPDATE.
+        
+        Use after bulk_create()/bulk_update()/update(), which bypass save().
+        """
+        qs = self if season is None else self.filter(season=season)
+        return qs.update(average_points=models.Case(
+            models.When(
+                games_played__gt=0,
+                then=models.F('total_fantasy_points') / models.F('games_played'),
+            ),
+            default=0.0,
+            output_field=models.FloatField(),
+        ))
+
+
+class NFLTeamStats(ChangedFieldsSaveMixin, models.Model):
     """Fantasy statistics for NFL teams per season"""
     nfl_team = models.ForeignKey(NFLTeam, on_delete=models.CASCADE, related_name='stats')
-    season = models.IntegerField()
+    season = models.IntegerField(db_index=True)
     total_fantasy_points = models.FloatField(default=0.0)
     games_played = models.IntegerField(default=0)
     average_points = models.FloatField(default=0.0)
@@ -56,8 +219,9 @@ class NFLTeamStats(models.Model):
     rushing_yards = models.IntegerField(default=0)
     receiving_yards = models.IntegerField(default=0)
     
+    objects = NFLTeamStatsQuerySet.as_manager()
+    
     class Meta:
-        ordering = ['-season', 'nfl_team']
         unique_together = ['nfl_team', 'season']
         verbose_name = "NFL Team Stat"
         verbose_name_plural = "NFL Team Stats"
@@ -71,9 +235,25 @@ class NFLTeamStats(models.Model):
             self.average_points = self.total_fantasy_points / self.games_played
         else:
             self.average_points = 0.0
+        # Keep the average in sync when only its inputs are being saved
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'total_fantasy_points', 'games_played'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'average_points'}
         super().save(*args, **kwargs)
 
 
+class MatchupQuerySet(models.QuerySet):
+    def with_winner(self):
+        """Load both teams and annotate `winner_id` (None for a tie) in the same query"""
+        return self.select_related('team1', 'team2').annotate(
+            winner_id=models.Case(
+                models.When(team1_score__gt=models.F('team2_score'), then=models.F('team1_id')),
+                models.When(team2_score__gt=models.F('team1_score'), then=models.F('team2_id')),
+                default=None,
+            )
+        )
+
+
 class Matchup(models.Model):
     """Individual fantasy league matchup/game"""
     season = models.IntegerField()
@@ -86,8 +266,15 @@ class Matchup(models.Model):
     is_playoff = models.BooleanField(default=False)
     is_championship = models.BooleanField(default=False)
     
+    objects = MatchupQuerySet.as_manager()
+    
     class Meta:
-        ordering = ['-season', '-week', 'match_date']
+        indexes = [
+            models.Index(fields=['-season', '-week']),
+            models.Index(fields=['season', 'is_playoff']),
+            models.Index(fields=['team1', '-season', '-week']),
+            models.Index(fields=['team2', '-season', '-week']),
+        ]
         verbose_name = "Matchup"
         verbose_name_plural = "Matchups"
     
@@ -96,6 +283,11 @@ class Matchup(models.Model):
     
     def winner(self):
         """Return the winning team"""
+        if hasattr(self, 'winner_id'):
+            # Annotated by MatchupQuerySet.with_winner()
+            if self.winner_id is None:
+                return None  # Tie
+            return self.team1 if self.winner_id == self.team1_id else self.team2
         if self.team1_score > self.team2_score:
             return self.team1
         elif self.team2_score > self.team1_score:
@@ -113,7 +305,11 @@ class PlayerScore(models.Model):
     nfl_team = models.ForeignKey(NFLTeam, on_delete=models.SET_NULL, null=True, blank=True, related_name='player_scores')
     
     class Meta:
-        ordering = ['-fantasy_points']
+        indexes = [
+            models.Index(fields=['-fantasy_points']),
+            models.Index(fields=['position', 'nfl_team']),
+            models.Index(fields=['team', '-fantasy_points']),
+        ]
         verbose_name = "Player Score"
         verbose_name_plural = "Player Scores"
     
@@ -121,7 +317,23 @@ class PlayerScore(models.Model):
         return f"{self.player_name} ({self.team.team_name}) - {self.fantasy_points} pts"
 
 
-class TeamRanking(models.Model):
+class TeamRankingQuerySet(models.QuerySet):
+    def recompute_averages(self, season=None):
+        """
+        Recalculate average_points for every row (optionally one season) in a single UPDATE.
+        
+        Use after bulk_create()/bulk_update()/update(), which bypass save().
+        """
+        qs = self if season is None else self.filter(season=season)
+        total_games = models.F('wins') + models.F('losses') + models.F('ties')
+        return qs.update(average_points=models.Case(
+            models.When(GreaterThan(total_games, 0), then=models.F('total_points') / total_games),
+            default=0.0,
+            output_field=models.FloatField(),
+        ))
+
+
+class TeamRanking(ChangedFieldsSaveMixin, models.Model):
     """Season rankings for fantasy teams"""
     team = models.ForeignKey(Teams, on_delete=models.CASCADE, related_name='rankings')
     season = models.IntegerField()
@@ -134,9 +346,13 @@ class TeamRanking(models.Model):
     playoff_appearance = models.BooleanField(default=False)
     championship = models.BooleanField(default=False)
     
+    objects = TeamRankingQuerySet.as_manager()
+    
     class Meta:
-        ordering = ['-season', 'rank']
         unique_together = ['team', 'season']
+        indexes = [
+            models.Index(fields=['-season', 'rank']),
+        ]
         verbose_name = "Team Ranking"
         verbose_name_plural = "Team Rankings"
     
@@ -150,4 +366,8 @@ class TeamRanking(models.Model):
             self.average_points = self.total_points / total_games
         else:
             self.average_points = 0.0
+        # Keep the average in sync when only its inputs are being saved
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'total_points', 'wins', 'losses', 'ties'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'average_points'}
         super().save(*args, **kwargs)
@@ -0,0 +1,25 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import TeamRanking, Teams
+
+
+@receiver(pre_save, sender=TeamRanking)
+def remember_previous_team(sender, instance, **kwargs):
+    """Note the team a loaded ranking belonged to, in case the save moves it"""
+    instance._previous_team_id = getattr(instance, '_loaded_values', {}).get('team_id')
+
+
+@receiver([post_save, post_delete], sender=TeamRanking)
+def refresh_team_ranking_stats(sender, instance, **kwargs):
+    """Keep the denormalized ranking totals of the ranking's team (old and new, if moved) in sync"""
+    team_ids = {instance.team_id, getattr(instance, '_previous_team_id', None)} - {None}
+    Teams.objects.filter(pk__in=team_ids).refresh_ranking_stats()
+    cache.delete_many([Teams.cache_key(team_id) for team_id in team_ids])
+
+
+@receiver([post_save, post_delete], sender=Teams)
+def invalidate_cached_team(sender, instance, **kwargs):
+    """Drop the copy cached by Teams.get_cached()"""
+    cache.delete(Teams.cache_key(instance.pk))
@@ -1,20 +1,73 @@
 """
 Utility functions for interacting with the Sleeper API
 """
+import gzip
+import json
+import logging
+import operator
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, Token, copy_context
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
+logger = logging.getLogger(__name__)
+
 SLEEPER_API_BASE = "https://api.sleeper.app/v1"
-SLEEPER_PLAYERS_CACHE_KEY = "sleeper_players"
+# Players data is cached as gzip-compressed JSON bytes rather than a pickled dict
+SLEEPER_PLAYERS_CACHE_KEY = "sleeper_players_gz"
+# Only these fields are used from the players data, so that's all we keep
+SLEEPER_PLAYER_FIELDS = ('first_name', 'last_name', 'position', 'team')
 # Cache players data for 24 hours (86400 seconds) - players data changes infrequently
 SLEEPER_PLAYERS_CACHE_TTL = getattr(settings, 'SLEEPER_PLAYERS_CACHE_TTL', 86400)
+# Keep the decoded players dict in process memory for 5 minutes to skip cache reads/decoding
+SLEEPER_PLAYERS_MEMO_TTL = 300
+# League info/users/rosters change during the season, so only cache them briefly
+SLEEPER_LEAGUE_CACHE_TTL = getattr(settings, 'SLEEPER_LEAGUE_CACHE_TTL', 60)
+# Stale league responses are kept for an hour so they can be revalidated with their ETag
+SLEEPER_STALE_CACHE_TTL = 3600
+
+# Upper bound on concurrent Sleeper requests, matching the session's connection pool
+SLEEPER_MAX_CONCURRENCY = 16
+
+# Shared session so connections (and TLS handshakes) to Sleeper are reused across calls.
+# Transient failures (connection errors, rate limiting, 5xx) are retried with a short backoff;
+# read timeouts are not, so a slow call fails after its own timeout instead of several.
+# Retry-After is ignored so a 429/503 can't make the request thread sleep for as long as it says.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=SLEEPER_MAX_CONCURRENCY,
+    max_retries=Retry(
+        total=2,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=False,
+    ),
+))
+SESSION.headers.update({'Accept': 'application/json', 'User-Agent': 'FantasyLeagueStats/1.0'})
+
+# Process-local copy of the decoded players data, see get_players
+_PLAYERS_MEMO = {"data": None, "index": None, "expires": 0.0}
+_PLAYERS_MEMO_LOCK = threading.Lock()
+
+# Per-request memo of Sleeper responses; None outside of a request (see middleware.py)
+_request_cache: ContextVar[Optional[Dict]] = ContextVar('sleeper_request_cache', default=None)
 
 
 def safe_int(value, default=0):
     """Safely convert a value to int, returning default if conversion fails or value is None"""
+    # Fast path: the Sleeper API normally sends numbers already
+    if type(value) is int:
+        return value
     if value is None:
         return default
     try:
@@ -25,6 +78,12 @@ def safe_int(value, default=0):
 
 def safe_float(value, default=0.0):
     """Safely convert a value to float, returning default if conversion fails or value is None"""
+    # Fast path: the Sleeper API normally sends numbers already
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     if value is None:
         return default
     try:
@@ -33,6 +92,108 @@ def safe_float(value, default=0.0):
         return default
 
 
+def begin_request_cache() -> Token:
+    """
+    Start a fresh per-request memo for Sleeper responses.
+    
+    Returns:
+        Token: Pass to `end_request_cache` once the request has been handled.
+    """
+    return _request_cache.set({})
+
+
+def end_request_cache(token: Token) -> None:
+    """Discard the per-request memo started by `begin_request_cache`."""
+    _request_cache.reset(token)
+
+
+def _fetch_json(path: str, etag: Optional[str] = None):
+    """
+    GET `path` from the Sleeper API, raising on HTTP errors.
+    
+    Returns:
+        tuple: `(etag, data)` with the response's ETag header and parsed JSON body,
+        or `None` if `etag` was given and the server answered 304 Not Modified.
+    """
+    headers = {'If-None-Match': etag} if etag else None
+    response = SESSION.get(f"{SLEEPER_API_BASE}{path}", headers=headers, timeout=10)
+    if etag and response.status_code == 304:
+        return None
+    response.raise_for_status()
+    return response.headers.get('ETag'), json.loads(response.content)
+
+
+def _cache_key(path: str) -> str:
+    """Cache key of the Sleeper API `path`, see _cached_get."""
+    return f"sleeper:{path}"
+
+
+def _peek_cached(path: str):
+    """Return the cached JSON body for `path`, however stale, without fetching it (None if not cached)."""
+    entry = cache.get(_cache_key(path))
+    return entry[2] if entry is not None else None
+
+
+def _cached_get(path: str, ttl: int = SLEEPER_LEAGUE_CACHE_TTL):
+    """
+    Return the JSON body for the Sleeper API `path`, memoized per request and
+    in the Django cache (keyed by path) for `ttl` seconds.
+    
+    Once a cached response is older than `ttl` it is revalidated with
+    If-None-Match, so an unchanged resource costs a body-less 304 instead of
+    a full download. Errors propagate to the caller and are never cached.
+    """
+    key = _cache_key(path)
+    memo = _request_cache.get()
+    if memo is not None and key in memo:
+        return memo[key]
+    
+    # Cache entries are (fetched_at, etag, data)
+    entry = cache.get(key)
+    if entry is not None and time.time() - entry[0] < ttl:
+        data = entry[2]
+    else:
+        etag = entry[1] if entry is not None else None
+        result = _fetch_json(path, etag)
+        if result is None:
+            data = entry[2]  # Not modified
+        else:
+            etag, data = result
+        cache.set(key, (time.time(), etag, data), max(ttl, SLEEPER_STALE_CACHE_TTL))
+    
+    if memo is not None:
+        memo[key] = data
+    return data
+
+
+def _run_concurrently(*calls):
+    """
+    Run `(func, *args)` calls on worker threads and return their results in order.
+    
+    Workers run in a copy of the caller's context so they share the per-request memo.
+    At most SLEEPER_MAX_CONCURRENCY calls run at once, matching the session's pool size.
+    """
+    with ThreadPoolExecutor(max_workers=min(len(calls), SLEEPER_MAX_CONCURRENCY)) as executor:
+        futures = [executor.submit(copy_context().run, *call) for call in calls]
+        return [future.result() for future in futures]
+
+
+def _index_by_roster_id(key: str, items: List[Dict]) -> Dict[str, Dict]:
+    """
+    Index rosters or teams by the string form of their `roster_id`.
+    
+    The index is memoized per request under `key`, so repeated lookups don't rebuild it.
+    """
+    memo = _request_cache.get()
+    if memo is not None and key in memo:
+        return memo[key]
+    
+    index = {str(item.get('roster_id')): item for item in items}
+    if memo is not None:
+        memo[key] = index
+    return index
+
+
 def get_league_info(league_id: str) -> Optional[Dict]:
     """
     Retrieve league metadata for the given Sleeper league identifier.
@@ -44,11 +205,9 @@ def get_league_info(league_id: str) -> Optional[Dict]:
         return None
     
     try:
-        response = requests.get(f"{SLEEPER_API_BASE}/league/{league_id}", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return _cached_get(f"/league/{league_id}")
     except (requests.RequestException, ValueError) as e:
-        print(f"Error fetching league info: {e}")
+        logger.error("Error fetching league info: %s", e)
         return None
 
 
@@ -63,11 +222,9 @@ def get_league_users(league_id: str) -> List[Dict]:
         return []
     
     try:
-        response = requests.get(f"{SLEEPER_API_BASE}/league/{league_id}/users", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return _cached_get(f"/league/{league_id}/users")
     except (requests.RequestException, ValueError) as e:
-        print(f"Error fetching league users: {e}")
+        logger.error("Error fetching league users: %s", e)
         return []
 
 
@@ -82,56 +239,117 @@ def get_league_rosters(league_id: str) -> List[Dict]:
         return []
     
     try:
-        response = requests.get(f"{SLEEPER_API_BASE}/league/{league_id}/rosters", timeout=10)
-        response.raise_for_status()
-        return response.json()
+        return _cached_get(f"/league/{league_id}/rosters")
     except (requests.RequestException, ValueError) as e:
-        print(f"Error fetching league rosters: {e}")
+        logger.error("Error fetching league rosters: %s", e)
         return []
 
 
+def _slim_players(players_data: Dict) -> Dict:
+    """Keep only SLEEPER_PLAYER_FIELDS for each player, which cuts the ~5MB dataset several times over."""
+    return {
+        player_id: {field: info.get(field) for field in SLEEPER_PLAYER_FIELDS if field in info}
+        for player_id, info in players_data.items()
+        if isinstance(info, dict)
+    }
+
+
+def _decode_players(payload: bytes) -> Dict:
+    """Decompress and parse a cached players payload."""
+    return json.loads(gzip.decompress(payload))
+
+
+def _build_player_index(players_data: Dict) -> Dict[str, Tuple[str, str, str]]:
+    """Map each player ID to its display `(name, position, team)`."""
+    return {
+        player_id: (
+            f"{info.get('first_name', '')} {info.get('last_name', '')}".strip() or f"Player {player_id}",
+            info.get('position', ''),
+            info.get('team', ''),
+        )
+        for player_id, info in players_data.items()
+    }
+
+
+def _remember_players(players_data: Dict) -> None:
+    """Keep `players_data` and its index in the process-local memo for SLEEPER_PLAYERS_MEMO_TTL seconds."""
+    index = _build_player_index(players_data)
+    with _PLAYERS_MEMO_LOCK:
+        _PLAYERS_MEMO["data"] = players_data
+        _PLAYERS_MEMO["index"] = index
+        _PLAYERS_MEMO["expires"] = time.time() + SLEEPER_PLAYERS_MEMO_TTL
+
+
 def get_players() -> Dict:
     """
     Fetch all NFL players from Sleeper API.
     Uses Django cache to avoid repeated fetches of the large dataset (~5MB).
+    Only SLEEPER_PLAYER_FIELDS are kept, and they are stored as gzip-compressed JSON,
+    which is much smaller than the pickled dict.
+    The decoded dict is also kept in process memory for a few minutes, since
+    roster lookups call this on every request.
     Cache TTL is configurable via SLEEPER_PLAYERS_CACHE_TTL setting (default: 24 hours).
     """
-    # Check cache first
-    cached_players = cache.get(SLEEPER_PLAYERS_CACHE_KEY)
-    if cached_players is not None:
-        print(f"DEBUG: Returning cached players data ({len(cached_players)} players)")
+    # Check the process-local memo first
+    with _PLAYERS_MEMO_LOCK:
+        if _PLAYERS_MEMO["expires"] > time.time():
+            return _PLAYERS_MEMO["data"]
+    
+    # Then the Django cache
+    cached_payload = cache.get(SLEEPER_PLAYERS_CACHE_KEY)
+    if cached_payload is not None:
+        cached_players = _decode_players(cached_payload)
+        _remember_players(cached_players)
+        logger.debug("Returning cached players data (%s players)", len(cached_players))
         return cached_players
     
     # Cache miss - fetch from API
-    print("DEBUG: Cache miss - fetching players data from Sleeper API...")
+    logger.debug("Cache miss - fetching players data from Sleeper API...")
     try:
-        response = requests.get(f"{SLEEPER_API_BASE}/players/nfl", timeout=60)
+        response = SESSION.get(f"{SLEEPER_API_BASE}/players/nfl", timeout=60)
         response.raise_for_status()
-        players_data = response.json()
+        players_data = _slim_players(json.loads(response.content))
         
         # Cache the successful response
-        cache.set(SLEEPER_PLAYERS_CACHE_KEY, players_data, SLEEPER_PLAYERS_CACHE_TTL)
-        print(f"DEBUG: Cached players data ({len(players_data)} players) for {SLEEPER_PLAYERS_CACHE_TTL} seconds")
+        payload = gzip.compress(json.dumps(players_data, separators=(',', ':')).encode(), compresslevel=3)
+        cache.set(SLEEPER_PLAYERS_CACHE_KEY, payload, SLEEPER_PLAYERS_CACHE_TTL)
+        _remember_players(players_data)
+        logger.debug("Cached players data (%s players) for %s seconds", len(players_data), SLEEPER_PLAYERS_CACHE_TTL)
         
         return players_data
     except requests.Timeout:
-        print("Timeout fetching players data (this is a large dataset)")
+        logger.error("Timeout fetching players data (this is a large dataset)")
         # Don't cache error responses
         return {}
     except (requests.RequestException, ValueError) as e:
-        print(f"Error fetching players: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching players: %s", e)
         # Don't cache error responses
         return {}
     except Exception as e:
-        print(f"Unexpected error fetching players: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error fetching players: %s", e)
         # Don't cache error responses
         return {}
 
 
+def get_player_index() -> Dict[str, Tuple[str, str, str]]:
+    """
+    Return the `(name, position, team)` of every NFL player, keyed by player ID.
+    
+    The index is built once whenever the players data is (re)loaded into the
+    process-local memo, so roster lookups only need a dict lookup per player.
+    """
+    with _PLAYERS_MEMO_LOCK:
+        if _PLAYERS_MEMO["expires"] > time.time():
+            return _PLAYERS_MEMO["index"]
+    
+    players_data = get_players()
+    with _PLAYERS_MEMO_LOCK:
+        if _PLAYERS_MEMO["data"] is players_data:
+            return _PLAYERS_MEMO["index"]
+    # get_players failed and returned uncached data
+    return _build_player_index(players_data)
+
+
 def get_team_avatar_url(avatar_id: str, thumbnail: bool = True) -> str:
     """
     Build the Sleeper CDN URL for a team's or user's avatar.
@@ -154,14 +372,15 @@ def get_team_avatar_url(avatar_id: str, thumbnail: bool = True) -> str:
 def get_league_teams(league_id: str) -> List[Dict]:
     """Fetch and combine league users and rosters to get team information.
     
-    Note: This function makes fresh API calls each time - no caching.
+    Note: League info, users and rosters, and the teams built from them, are cached
+    for SLEEPER_LEAGUE_CACHE_TTL seconds.
     """
     """
     Assemble team entries for a Sleeper league by combining league users and rosters.
     
     Each returned team dictionary contains metadata for a single roster, including:
     `user_id`, `username`, `display_name`, `team_name`, `avatar`, `avatar_url`,
-    `roster_id`, `division` (if available), `wins`, `losses`, `ties`, `fpts`,
+    `roster_id`, `division` (empty if unavailable), `wins`, `losses`, `ties`, `fpts`,
     `fpts_decimal`, and `total_points` (calculated as `fpts + fpts_decimal/100`).
     
     Returns:
@@ -169,13 +388,36 @@ def get_league_teams(league_id: str) -> List[Dict]:
         `league_id` is falsy or data cannot be retrieved.
     """
     if not league_id:
-        print(f"DEBUG: get_league_teams called with empty league_id")
+        logger.debug("get_league_teams called with empty league_id")
         return []
     
-    print(f"DEBUG: get_league_teams fetching data for league_id: {league_id}")
+    logger.debug("get_league_teams fetching data for league_id: %s", league_id)
     
-    # Fetch league info to check for divisions
-    league_info = get_league_info(league_id)
+    key = f"sleeper:teams:{league_id}"
+    teams = cache.get(key)
+    if teams is None:
+        league_info, users, rosters = _get_league_bundle(league_id)
+        teams = _build_league_teams(league_info, users, rosters)
+        # The fetch helpers return None/[] on errors; only cache teams built from every response
+        if teams and league_info is not None and users:
+            cache.set(key, teams, SLEEPER_LEAGUE_CACHE_TTL)
+    
+    logger.debug("get_league_teams returning %s teams for league_id: %s", len(teams), league_id)
+    return teams
+
+
+def _get_league_bundle(league_id: str) -> Tuple[Optional[Dict], List[Dict], List[Dict]]:
+    """Fetch league info (to check for divisions), users and rosters in parallel."""
+    league_info, users, rosters = _run_concurrently(
+        (get_league_info, league_id),
+        (get_league_users, league_id),
+        (get_league_rosters, league_id),
+    )
+    return league_info, users, rosters
+
+
+def _build_league_teams(league_info: Optional[Dict], users: List[Dict], rosters: List[Dict]) -> List[Dict]:
+    """Combine league info, users and rosters into the team dictionaries returned by get_league_teams."""
     divisions = []
     if league_info and league_info.get('settings'):
         # Divisions can be stored as a list of division names
@@ -188,24 +430,24 @@ def get_league_teams(league_id: str) -> List[Dict]:
             elif isinstance(divisions_raw, (int, float)):
                 divisions = [f"Division {i+1}" for i in range(int(divisions_raw))]
     
-    # Fetch users and rosters
-    users = get_league_users(league_id)
-    rosters = get_league_rosters(league_id)
+    # Map division numbers to names once: 1-indexed first, with 0 falling back to the first division
+    division_by_num = {i: name for i, name in enumerate(divisions, start=1)}
+    if divisions:
+        division_by_num[0] = divisions[0]
     
     # Create a mapping of owner_id to roster
     roster_by_owner = {roster['owner_id']: roster for roster in rosters if roster.get('owner_id')}
     
+    # Pair each user with their roster, skipping users without one
+    pairs = [
+        (user['user_id'], user, roster_by_owner[user['user_id']])
+        for user in users
+        if user.get('user_id') in roster_by_owner
+    ]
+    
     # Combine user and roster data
     teams = []
-    for user in users:
-        user_id = user.get('user_id')
-        if not user_id:
-            continue
-        
-        roster = roster_by_owner.get(user_id)
-        if not roster:
-            continue
-        
+    for user_id, user, roster in pairs:
         # Get team name from metadata or use display_name
         metadata = user.get('metadata', {}) or {}
         team_name = metadata.get('team_name') or user.get('display_name') or user.get('username', 'Unknown Team')
@@ -226,21 +468,17 @@ def get_league_teams(league_id: str) -> List[Dict]:
             
             if division_num is not None:
                 try:
-                    division_num = int(division_num)
-                    # Try 1-indexed first
-                    if 1 <= division_num <= len(divisions):
-                        division = divisions[division_num - 1]
-                    # If that fails, fall back to 0-indexed
-                    elif 0 <= division_num < len(divisions):
-                        division = divisions[division_num]
-                    else:
-                        print(f"DEBUG: division_num {division_num} out of range for {len(divisions)} divisions")
+                    division = division_by_num.get(int(division_num))
+                    if division is None:
+                        logger.debug("division_num %s out of range for %s divisions", division_num, len(divisions))
                 except (ValueError, TypeError) as e:
-                    print(f"DEBUG: Error converting division_num: {e}")
-                    pass
+                    logger.debug("Error converting division_num: %s", e)
             
-            if division is None and divisions:
-                print(f"DEBUG: Team {team_name} has no division assigned. Roster keys: {list(roster.keys())}, settings keys: {list(roster.get('settings', {}).keys())}")
+            if division is None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Team %s has no division assigned. Roster keys: %s, settings keys: %s",
+                    team_name, list(roster.keys()), list((roster.get('settings') or {}).keys()),
+                )
         
         # Safely extract and convert numeric values from roster settings
         # Explicitly handle None values - .get() with defaults only protects against missing keys, not None
@@ -265,7 +503,7 @@ def get_league_teams(league_id: str) -> List[Dict]:
             'avatar': user.get('avatar', ''),
             'avatar_url': get_team_avatar_url(user.get('avatar', '')),
             'roster_id': roster.get('roster_id'),
-            'division': division,
+            'division': division or '',
             'wins': safe_int(settings.get('wins'), 0),
             'losses': safe_int(settings.get('losses'), 0),
             'ties': safe_int(settings.get('ties'), 0),
@@ -276,108 +514,151 @@ def get_league_teams(league_id: str) -> List[Dict]:
         teams.append(team_data)
     
     # Sort by division if available, then by team name
-    if divisions:
-        teams.sort(key=lambda x: (x['division'] or '', x['team_name']))
-    else:
-        teams.sort(key=lambda x: x['team_name'])
+    teams.sort(key=operator.itemgetter('division', 'team_name'))
     
-    print(f"DEBUG: get_league_teams returning {len(teams)} teams for league_id: {league_id}")
     return teams
 
 
+async def aget_league_teams(league_id: str) -> List[Dict]:
+    """
+    Async version of get_league_teams for async views and other coroutines.
+    
+    The blocking fetch runs on a worker thread, so the event loop stays free,
+    and it still goes through the shared keep-alive session and caches.
+    """
+    return await sync_to_async(get_league_teams, thread_sensitive=False)(league_id)
+
+
+def get_many_league_teams(league_ids: List[str]) -> List[List[Dict]]:
+    """
+    Fetch the teams of several leagues at once.
+    
+    Each league goes through get_league_teams (and so its cache) on its own
+    worker thread, instead of one league after another.
+    
+    Returns:
+        List[List[Dict]]: The get_league_teams result for each league id, in order
+        (empty for falsy ids).
+    """
+    unique_ids = list(dict.fromkeys(league_id for league_id in league_ids if league_id))
+    results = _run_concurrently(*((get_league_teams, league_id) for league_id in unique_ids)) if unique_ids else []
+    teams_by_league = dict(zip(unique_ids, results))
+    return [teams_by_league.get(league_id, []) for league_id in league_ids]
+
+
+async def aget_many_league_teams(league_ids: List[str]) -> List[List[Dict]]:
+    """Async version of get_many_league_teams, see aget_league_teams."""
+    return await sync_to_async(get_many_league_teams, thread_sensitive=False)(league_ids)
+
+
 def get_team_by_roster_id(league_id: str, roster_id: int) -> Optional[Dict]:
     """Get a specific team's information by roster_id"""
     if not league_id or roster_id is None:
         return None
     
     teams = get_league_teams(league_id)
-    for team in teams:
-        # Handle both int and string roster_id comparisons
-        team_roster_id = team.get('roster_id')
-        if team_roster_id == roster_id or str(team_roster_id) == str(roster_id):
-            return team
-    return None
+    # Handle both int and string roster_id comparisons
+    return _index_by_roster_id(f"team_index:{league_id}", teams).get(str(roster_id))
+
+
+def _roster_is_cached(league_id: str, roster_id: int) -> bool:
+    """Whether the cached (possibly stale) league rosters include `roster_id`, without fetching them"""
+    rosters = _peek_cached(f"/league/{league_id}/rosters")
+    return rosters is not None and any(str(roster.get('roster_id')) == str(roster_id) for roster in rosters)
+
+
+def get_team_and_roster_players(league_id: str, roster_id: int) -> Tuple[Optional[Dict], List[Dict]]:
+    """
+    Get a team by roster_id together with its roster players.
+    
+    When the cached rosters already show the roster exists, the players data is
+    loaded while the league is being fetched, so the two latencies overlap.
+    Otherwise the players data is only loaded once the team is found, so ids that
+    aren't Sleeper rosters (team_detail's database fallback) never pay for it.
+    """
+    if not league_id or roster_id is None:
+        return None, []
+    
+    if _roster_is_cached(league_id, roster_id):
+        team, _ = _run_concurrently(
+            (get_team_by_roster_id, league_id, roster_id),
+            (get_player_index,),
+        )
+    else:
+        team = get_team_by_roster_id(league_id, roster_id)
+    if team is None:
+        return None, []
+    return team, get_roster_players(league_id, roster_id)
 
 
 def get_roster_players(league_id: str, roster_id: int) -> List[Dict]:
-    """Get the current roster players for a specific roster"""
+    """Get the current roster players for a specific roster (cached for SLEEPER_LEAGUE_CACHE_TTL seconds)"""
     if not league_id or roster_id is None:
         return []
     
+    key = f"sleeper:roster_players:{league_id}:{roster_id}"
+    cached_players = cache.get(key)
+    if cached_players is not None:
+        return cached_players
+    
     try:
-        rosters = get_league_rosters(league_id)
-        print(f"DEBUG: Looking for roster_id={roster_id}, found {len(rosters)} rosters")
+        # Fetch rosters and the (large, slow) players data in parallel.
+        # get_players handles its own errors and returns {} on failure,
+        # in which case we'll show player IDs.
+        rosters, player_index = _run_concurrently(
+            (get_league_rosters, league_id),
+            (get_player_index,),
+        )
+        logger.debug("Looking for roster_id=%s, found %s rosters", roster_id, len(rosters))
         
-        for roster in rosters:
-            # Handle both int and string roster_id comparisons
-            roster_id_from_api = roster.get('roster_id')
-            if roster_id_from_api == roster_id or str(roster_id_from_api) == str(roster_id):
-                player_ids = roster.get('players') or []
-                starters = roster.get('starters') or []
-                reserve = roster.get('reserve') or []
-                
-                print(f"DEBUG: Found roster with {len(player_ids)} players, {len(starters)} starters, {len(reserve)} reserve")
-                print(f"DEBUG: player_ids empty? {not player_ids}, starters exists? {bool(starters)}")
-                
-                # If players list is empty but we have starters, use starters + reserve as the player list
-                # Check explicitly for empty list and non-empty starters
-                if len(player_ids) == 0 and len(starters) > 0:
-                    print(f"DEBUG: players list is empty, using starters and reserve as player list")
-                    # Combine starters and reserve, removing duplicates
-                    all_player_ids = list(set(starters + reserve))
-                    player_ids = all_player_ids
-                    print(f"DEBUG: Combined player list has {len(player_ids)} players")
-                elif not player_ids:
-                    print(f"DEBUG: WARNING - No players and no starters found in roster!")
-                
-                # Convert all to strings for consistent comparison
-                starters_set = {str(s) for s in starters}
-                reserve_set = {str(r) for r in reserve}
-                
-                # Fetch player data (this is a large call, might be slow)
-                players_data = {}
-                try:
-                    print("DEBUG: Fetching players data...")
-                    players_data = get_players()
-                    print(f"DEBUG: Fetched {len(players_data)} players")
-                except Exception as e:
-                    print(f"Error fetching players data: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Continue without player data - we'll show player IDs
-                
-                roster_players = []
-                for player_id in player_ids:
-                    player_id_str = str(player_id)
-                    player_info = players_data.get(player_id_str, {}) if players_data else {}
-                    
-                    # If player info not found, still add player with minimal info
-                    if not player_info:
-                        roster_players.append({
-                            'player_id': player_id,
-                            'name': f"Player {player_id}",
-                            'position': '',
-                            'team': '',
-                            'is_starter': player_id_str in starters_set,
-                            'is_reserve': player_id_str in reserve_set,
-                        })
-                    else:
-                        roster_players.append({
-                            'player_id': player_id,
-                            'name': f"{player_info.get('first_name', '')} {player_info.get('last_name', '')}".strip() or f"Player {player_id}",
-                            'position': player_info.get('position', ''),
-                            'team': player_info.get('team', ''),
-                            'is_starter': player_id_str in starters_set,
-                            'is_reserve': player_id_str in reserve_set,
-                        })
-                
-                print(f"DEBUG: Returning {len(roster_players)} roster players")
-                return roster_players
+        # Handle both int and string roster_id comparisons
+        roster = _index_by_roster_id(f"roster_index:{league_id}", rosters).get(str(roster_id))
+        if roster is None:
+            logger.debug("Roster with id %s not found", roster_id)
+            return []
         
-        print(f"DEBUG: Roster with id {roster_id} not found")
-        return []
+        player_ids = roster.get('players') or []
+        starters = roster.get('starters') or []
+        reserve = roster.get('reserve') or []
+        
+        logger.debug(
+            "Found roster with %s players, %s starters, %s reserve",
+            len(player_ids), len(starters), len(reserve),
+        )
+        
+        # If players list is empty but we have starters, use starters + reserve as the player list
+        # Check explicitly for empty list and non-empty starters
+        if len(player_ids) == 0 and len(starters) > 0:
+            logger.debug("players list is empty, using starters and reserve as player list")
+            # Combine starters and reserve, removing duplicates
+            player_ids = list({*starters, *reserve})
+            logger.debug("Combined player list has %s players", len(player_ids))
+        elif not player_ids:
+            logger.warning("No players and no starters found in roster %s", roster_id)
+        
+        # Convert all to strings for consistent comparison
+        starters_set = set(map(str, starters))
+        reserve_set = set(map(str, reserve))
+        
+        roster_players = []
+        for player_id in player_ids:
+            player_id_str = str(player_id)
+            # If player info not found, still add player with minimal info
+            name, position, team = player_index.get(player_id_str) or (f"Player {player_id}", '', '')
+            roster_players.append({
+                'player_id': player_id,
+                'name': name,
+                'position': position,
+                'team': team,
+                'is_starter': player_id_str in starters_set,
+                'is_reserve': player_id_str in reserve_set,
+            })
+        
+        logger.debug("Returning %s roster players", len(roster_players))
+        # Without the players data every entry is a "Player <id>" placeholder, so don't cache that
+        if player_index:
+            cache.set(key, roster_players, SLEEPER_LEAGUE_CACHE_TTL)
+        return roster_players
     except Exception as e:
-        print(f"Error in get_roster_players: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_roster_players: %s", e)
         return []
\ No newline at end of file
@@ -1,3 +1,186 @@
-from django.test import TestCase
+import json
+import time
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from . import sleeper_api
+from .models import TeamRanking, Teams
+
+
+class ChangedFieldsSaveMixinTests(TestCase):
+    def setUp(self):
+        self.team = Teams.objects.create(team_id=1, team_name='Team 1', user_id=1)
+        self.ranking = TeamRanking.objects.create(team=self.team, season=2023, rank=1, wins=5)
+
+    def test_refresh_from_db_resets_loaded_values(self):
+        ranking = TeamRanking.objects.get(pk=self.ranking.pk)
+        TeamRanking.objects.filter(pk=ranking.pk).update(wins=7)
+        ranking.refresh_from_db()
+        ranking.wins = 5
+        ranking.save()
+        self.assertEqual(TeamRanking.objects.get(pk=ranking.pk).wins, 5)
+
+    def test_unchanged_save_skips_update(self):
+        ranking = TeamRanking.objects.get(pk=self.ranking.pk)
+        with CaptureQueriesContext(connection) as queries:
+            ranking.save()
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]['sql'].startswith('SELECT'))
+
+    def test_changed_save_writes_only_changed_columns(self):
+        ranking = TeamRanking.objects.get(pk=self.ranking.pk)
+        ranking.rank = 2
+        with CaptureQueriesContext(connection) as queries:
+            ranking.save()
+        update = next(q['sql'] for q in queries if q['sql'].startswith('UPDATE "fantasyleague_teamranking"'))
+        self.assertIn('"rank"', update)
+        self.assertNotIn('"wins"', update)
+
+    def test_save_after_row_deleted_inserts_it_again(self):
+        ranking = TeamRanking.objects.get(pk=self.ranking.pk)
+        TeamRanking.objects.filter(pk=ranking.pk).delete()
+        ranking.wins = 8
+        ranking.save()
+        self.assertEqual(TeamRanking.objects.get(pk=ranking.pk).wins, 8)
+
+    def test_unchanged_save_after_row_deleted_inserts_it_again(self):
+        ranking = TeamRanking.objects.get(pk=self.ranking.pk)
+        TeamRanking.objects.filter(pk=ranking.pk).delete()
+        ranking.save()
+        self.assertTrue(TeamRanking.objects.filter(pk=ranking.pk).exists())
+
+    def test_save_with_cleared_pk_inserts_copy(self):
+        ranking = TeamRanking.objects.get(pk=self.ranking.pk)
+        ranking.pk = None
+        ranking.season = 2024
+        ranking.save()
+        self.assertNotEqual(ranking.pk, self.ranking.pk)
+        self.assertEqual(TeamRanking.objects.filter(team=self.team).count(), 2)
+
+
+class TeamRankingStatsTests(TestCase):
+    def setUp(self):
+        self.team_a = Teams.objects.create(team_id=1, team_name='Team A', user_id=1)
+        self.team_b = Teams.objects.create(team_id=2, team_name='Team B', user_id=2)
+
+    def assertTotals(self, team, total_wins, championships, seasons_played, best_rank):
+        team.refresh_from_db()
+        self.assertEqual(
+            (team.total_wins, team.championships, team.seasons_played, team.best_rank),
+            (total_wins, championships, seasons_played, best_rank),
+        )
+
+    def test_totals_follow_create_move_and_delete(self):
+        TeamRanking.objects.create(team=self.team_a, season=2022, rank=4, wins=6)
+        ranking = TeamRanking.objects.create(team=self.team_a, season=2023, rank=1, wins=9, championship=True)
+        self.assertTotals(self.team_a, 15, 1, 2, 1)
+
+        ranking = TeamRanking.objects.get(pk=ranking.pk)
+        ranking.team = self.team_b
+        ranking.save()
+        self.assertTotals(self.team_a, 6, 0, 1, 4)
+        self.assertTotals(self.team_b, 9, 1, 1, 1)
+
+        ranking.delete()
+        self.assertTotals(self.team_b, 0, 0, 0, 0)
+
+    def test_saving_stale_team_keeps_totals(self):
+        team = Teams.objects.get(pk=self.team_a.pk)
+        TeamRanking.objects.create(team=self.team_a, season=2023, rank=1, wins=9, championship=True)
+        team.team_name = 'Renamed'
+        team.save()
+        self.assertTotals(self.team_a, 9, 1, 1, 1)
+        self.assertEqual(Teams.objects.get(pk=self.team_a.pk).team_name, 'Renamed')
+
+    def test_saving_new_team_with_existing_id_keeps_totals(self):
+        TeamRanking.objects.create(team=self.team_a, season=2023, rank=1, wins=9)
+        Teams(team_id=self.team_a.pk, team_name='Team A', user_id=1).save()
+        self.assertTotals(self.team_a, 9, 0, 1, 1)
+
+
+def _response(data=None, status=200, etag=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = b'' if data is None else json.dumps(data).encode()
+    if etag:
+        response.headers['ETag'] = etag
+    return response
+
+
+class SleeperCacheTests(SimpleTestCase):
+    LEAGUE = {'league_id': 'L', 'settings': {'divisions': 1}}
+    USERS = [{'user_id': '1', 'display_name': 'Owner'}]
+    ROSTERS = [{'roster_id': 1, 'owner_id': '1', 'players': ['10'], 'starters': ['10'], 'settings': {'division': 1}}]
+    PLAYERS = {'10': {'first_name': 'Pat', 'last_name': 'M', 'position': 'QB', 'team': 'KC'}}
+
+    def setUp(self):
+        cache.clear()
+        sleeper_api._PLAYERS_MEMO.update(data=None, index=None, expires=0.0)
+        self.failing = set()
+        patcher = mock.patch.object(sleeper_api.SESSION, 'get', side_effect=self._get)
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, url, headers=None, timeout=None):
+        path = url[len(sleeper_api.SLEEPER_API_BASE):]
+        if path in self.failing:
+            raise requests.Timeout(path)
+        if path == '/players/nfl':
+            return _response(self.PLAYERS)
+        if path.endswith('/users'):
+            return _response(self.USERS, etag='"users"')
+        if path.endswith('/rosters'):
+            return _response(self.ROSTERS, etag='"rosters"')
+        if headers and headers.get('If-None-Match') == '"league"':
+            return _response(status=304)
+        return _response(self.LEAGUE, etag='"league"')
+
+    def test_fresh_entry_is_served_from_cache(self):
+        self.assertEqual(sleeper_api.get_league_info('L'), self.LEAGUE)
+        self.assertEqual(sleeper_api.get_league_info('L'), self.LEAGUE)
+        self.assertEqual(self.get.call_count, 1)
+
+    def test_stale_entry_is_revalidated_with_etag(self):
+        key = sleeper_api._cache_key('/league/L')
+        cache.set(key, (time.time() - 3600, '"league"', {'cached': True}), 3600)
+        self.assertEqual(sleeper_api.get_league_info('L'), {'cached': True})
+        self.assertEqual(self.get.call_args.kwargs['headers'], {'If-None-Match': '"league"'})
+        fetched_at, etag, data = cache.get(key)
+        self.assertLess(time.time() - fetched_at, sleeper_api.SLEEPER_LEAGUE_CACHE_TTL)
+        self.assertEqual((etag, data), ('"league"', {'cached': True}))
+
+    def test_errors_are_not_cached(self):
+        self.failing.add('/league/L')
+        with self.assertLogs('fantasyleague.sleeper_api', 'ERROR'):
+            self.assertIsNone(sleeper_api.get_league_info('L'))
+        self.assertIsNone(cache.get(sleeper_api._cache_key('/league/L')))
+        self.failing.clear()
+        self.assertEqual(sleeper_api.get_league_info('L'), self.LEAGUE)
+
+    def test_teams_are_cached(self):
+        teams = sleeper_api.get_league_teams('L')
+        self.assertEqual(len(teams), 1)
+        self.assertEqual(cache.get('sleeper:teams:L'), teams)
+
+    def test_teams_are_not_cached_when_league_info_fails(self):
+        self.failing.add('/league/L')
+        with self.assertLogs('fantasyleague.sleeper_api', 'ERROR'):
+            self.assertEqual(len(sleeper_api.get_league_teams('L')), 1)
+        self.assertIsNone(cache.get('sleeper:teams:L'))
+
+    def test_roster_players_are_cached(self):
+        players = sleeper_api.get_roster_players('L', 1)
+        self.assertEqual(players[0]['name'], 'Pat M')
+        self.assertEqual(cache.get('sleeper:roster_players:L:1'), players)
+
+    def test_roster_players_are_not_cached_when_players_data_fails(self):
+        self.failing.add('/players/nfl')
+        with self.assertLogs('fantasyleague.sleeper_api', 'WARNING'):
+            players = sleeper_api.get_roster_players('L', 1)
+        self.assertEqual(players[0]['name'], 'Player 10')
+        self.assertIsNone(cache.get('sleeper:roster_players:L:1'))
@@ -1,15 +1,24 @@
+import logging
+from collections import defaultdict
+from django.core.paginator import Paginator
 from django.shortcuts import render, get_object_or_404
-from django.db.models import Max, Min, Sum, Q, Count, Avg
+from django.db.models import Max, Min, Sum, Q, Count, Avg, Case, When, F
 from django.conf import settings
 from .models import Teams, TeamRanking, Matchup, PlayerScore
-from .sleeper_api import get_league_teams, get_team_by_roster_id, get_roster_players, get_league_info
+from .sleeper_api import get_league_teams, get_team_and_roster_players, get_league_info
+
+
+logger = logging.getLogger(__name__)
+
+# Seasons shown in the team_detail rankings table and per team_insights page
+SEASONS_PER_PAGE = 25
 
 
 def index(request):
     """
     Render the main dashboard with aggregated league overview statistics.
     
-    Builds context containing total teams, total seasons, latest season, top teams by cumulative points, and recent champions, then renders the 'fantasyleague/index.html' template.
+    Builds context containing total teams, total seasons, latest season, and recent champions, then renders the 'fantasyleague/index.html' template.
     
     Returns:
         HttpResponse: Rendered dashboard page with the computed context.
@@ -29,32 +38,23 @@ def index(request):
     
     # Count finished seasons (seasons that are not the current season)
     # If we have a current season, count all distinct seasons less than current
-    # Otherwise, count all distinct seasons except the current one if it exists
-    if current_season:
-        finished_seasons = TeamRanking.objects.filter(
-            season__lt=current_season
-        ).values('season').distinct().count()
-    else:
-        # Fallback: count all distinct seasons from database
-        all_seasons = TeamRanking.objects.values('season').distinct().count()
-        finished_seasons = all_seasons
-    
-    # Get top teams by total points across all seasons
-    latest_season_db = TeamRanking.objects.aggregate(Max('season'))['season__max']
-    top_teams = Teams.objects.annotate(
-        total_points=Sum('rankings__total_points')
-    ).order_by('-total_points')[:5] if latest_season_db else []
+    # Otherwise, fall back to counting all distinct seasons from the database
+    finished_seasons = TeamRanking.objects.aggregate(
+        finished_seasons=Count(
+            'season', distinct=True,
+            filter=Q(season__lt=current_season) if current_season else None,
+        )
+    )['finished_seasons']
     
     # Get recent champions
-    recent_champions = TeamRanking.objects.filter(
+    recent_champions = list(TeamRanking.objects.filter(
         championship=True
-    ).select_related('team').order_by('-season')[:5]
+    ).select_related('team').only('season', 'team', 'team__team_name').order_by('-season')[:5])
     
     context = {
         'total_teams': total_teams,
         'total_seasons': finished_seasons,
         'current_season': current_season,
-        'top_teams': top_teams,
         'recent_champions': recent_champions,
     }
     return render(request, 'fantasyleague/index.html', context)
@@ -73,38 +73,25 @@ def team_list(request):
             - has_divisions: boolean indicating whether divisions were detected
     """
     league_id = settings.SLEEPER_LEAGUE_ID
-    print(f"DEBUG: team_list using league_id: {league_id}")
+    logger.debug("team_list using league_id: %s", league_id)
     
     # Fetch teams from Sleeper API
     sleeper_teams = get_league_teams(league_id) if league_id else []
-    print(f"DEBUG: Fetched {len(sleeper_teams)} teams from Sleeper API")
+    logger.debug("Fetched %s teams from Sleeper API", len(sleeper_teams))
     
-    # Also get database stats if available
-    db_teams = Teams.objects.annotate(
-        total_wins=Sum('rankings__wins'),
-        total_losses=Sum('rankings__losses'),
-        championships=Count('rankings__id', filter=Q(rankings__championship=True)),
-        seasons_played=Count('rankings__id', distinct=True),
-        best_rank=Min('rankings__rank')
+    # Also get database stats if available (denormalized onto Teams from their rankings)
+    db_teams = Teams.objects.only(
+        'team_id', 'user_id', 'total_wins', 'total_losses',
+        'championships', 'seasons_played', 'best_rank',
     )
     
-    # Create a mapping of user_id to database stats
-    db_stats_by_user = {}
-    for team in db_teams:
-        db_stats_by_user[team.user_id] = {
-            'total_wins': team.total_wins or 0,
-            'total_losses': team.total_losses or 0,
-            'championships': team.championships or 0,
-            'best_rank': team.best_rank or 0,
-            'seasons_played': team.seasons_played or 0,
-        }
-    
-    # Create a mapping of user_id to Teams model for linking
-    db_teams_by_user = {team.user_id: team for team in Teams.objects.all()}
+    # Map user_id to the Teams model, which carries both the stats and the id for linking
+    db_teams_by_user = {team.user_id: team for team in db_teams}
     
-    # Combine Sleeper API data with database stats
+    # Combine Sleeper API data with database stats, bucketing teams by division as we go
     teams_with_stats = []
     divisions = set()
+    teams_by_division = defaultdict(list)
     
     for sleeper_team in sleeper_teams:
         user_id = sleeper_team.get('user_id')
@@ -116,7 +103,6 @@ def team_list(request):
             except (ValueError, TypeError):
                 pass
         
-        db_stats = db_stats_by_user.get(user_id_int, {}) if user_id_int else {}
         db_team = db_teams_by_user.get(user_id_int) if user_id_int else None
         
         division = sleeper_team.get('division')
@@ -126,7 +112,7 @@ def team_list(request):
         # Use database team_id if available, otherwise use roster_id
         team_id = db_team.team_id if db_team else sleeper_team.get('roster_id')
         
-        teams_with_stats.append({
+        team = {
             'team_name': sleeper_team.get('team_name', 'Unknown Team'),
             'display_name': sleeper_team.get('display_name', ''),
             'username': sleeper_team.get('username', ''),
@@ -140,32 +126,25 @@ def team_list(request):
             'current_ties': sleeper_team.get('ties', 0),
             'current_points': sleeper_team.get('total_points', 0),
             # Historical stats from database
-            'total_wins': db_stats.get('total_wins', 0),
-            'total_losses': db_stats.get('total_losses', 0),
-            'championships': db_stats.get('championships', 0),
-            'best_rank': db_stats.get('best_rank', 0),
-            'seasons_played': db_stats.get('seasons_played', 0),
+            'total_wins': db_team.total_wins if db_team else 0,
+            'total_losses': db_team.total_losses if db_team else 0,
+            'championships': db_team.championships if db_team else 0,
+            'best_rank': db_team.best_rank if db_team else 0,
+            'seasons_played': db_team.seasons_played if db_team else 0,
             'has_db_record': db_team is not None,
-        })
+        }
+        teams_with_stats.append(team)
+        # Teams without a division are grouped as "Unassigned"
+        teams_by_division[division or "Unassigned"].append(team)
     
     # Group by division if divisions exist
-    teams_by_division = {}
     if divisions:
-        for team in teams_with_stats:
-            div = team.get('division')
-            # Only group teams that have a division assigned
-            if div:
-                if div not in teams_by_division:
-                    teams_by_division[div] = []
-                teams_by_division[div].append(team)
-            else:
-                teams_by_division.setdefault("Unassigned", []).append(team)
-                # Log teams without division for debugging
-                print(f"DEBUG: Team {team.get('team_name')} has no division assigned")
+        # Log teams without division for debugging (once, not per team)
+        if "Unassigned" in teams_by_division:
+            logger.debug("%s teams have no division assigned", len(teams_by_division["Unassigned"]))
         
         # Sort divisions alphabetically
-        sorted_divisions = sorted(teams_by_division.items(), key=lambda x: x[0])
-        teams_by_division = dict(sorted_divisions)
+        teams_by_division = dict(sorted(teams_by_division.items()))
     else:
         teams_by_division = {'All Teams': teams_with_stats}
     
@@ -188,44 +167,43 @@ def team_detail(request, team_id):
     if league_id:
         try:
             roster_id = int(team_id)
-            print(f"DEBUG: team_detail called with team_id={team_id}, converted to roster_id={roster_id}")
-            sleeper_team = get_team_by_roster_id(league_id, roster_id)
-            print(f"DEBUG: sleeper_team found: {sleeper_team is not None}")
-            if sleeper_team:
-                try:
-                    print(f"DEBUG: Fetching roster players for roster_id={roster_id}")
-                    roster_players = get_roster_players(league_id, roster_id)
-                    print(f"DEBUG: Got {len(roster_players)} roster players")
-                except Exception as e:
-                    print(f"Error fetching roster players: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    roster_players = []  # Continue with empty roster
+            logger.debug("team_detail called with team_id=%s, converted to roster_id=%s", team_id, roster_id)
+            # Looks up the team and loads the players data concurrently
+            sleeper_team, roster_players = get_team_and_roster_players(league_id, roster_id)
+            logger.debug("sleeper_team found: %s", sleeper_team is not None)
+            logger.debug("Got %s roster players", len(roster_players))
         except (ValueError, TypeError) as e:
-            print(f"Error converting team_id to roster_id: {e}")
+            logger.debug("Error converting team_id to roster_id: %s", e)
             pass
         except Exception as e:
-            print(f"Unexpected error in team_detail (Sleeper): {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Unexpected error in team_detail (Sleeper): %s", e)
     
     # If not found in Sleeper, try database
     db_team = None
     rankings = []
     if not sleeper_team:
         try:
-            db_team = Teams.objects.get(pk=team_id)
-            # Get all rankings for this team
-            rankings = TeamRanking.objects.filter(team=db_team).order_by('-season')
+            db_team = Teams.get_cached(team_id)
+            # Get all rankings for this team as plain dicts for the table
+            rankings = TeamRanking.objects.filter(team=db_team).values(
+                'season', 'rank', 'wins', 'losses', 'ties', 'total_points',
+                'average_points', 'playoff_appearance', 'championship',
+            ).order_by('-season')
         except Teams.DoesNotExist:
             pass
     
     # If we have Sleeper team data, use it
     if sleeper_team:
-        # Separate players by status
-        starters = [p for p in roster_players if p.get('is_starter')]
-        bench = [p for p in roster_players if not p.get('is_starter') and not p.get('is_reserve')]
-        reserve = [p for p in roster_players if p.get('is_reserve')]
+        # Separate players by status in a single pass
+        starters, bench, reserve = [], [], []
+        for player in roster_players:
+            is_starter, is_reserve = player.get('is_starter'), player.get('is_reserve')
+            if is_starter:
+                starters.append(player)
+            if is_reserve:
+                reserve.append(player)
+            elif not is_starter:
+                bench.append(player)
         
         context = {
             'team_name': sleeper_team.get('team_name', 'Unknown Team'),
@@ -244,51 +222,51 @@ def team_detail(request, team_id):
     
     # Fallback to database team if available
     if db_team:
-        # Calculate achievements
-        championships = rankings.filter(championship=True).count()
-        playoff_appearances = rankings.filter(playoff_appearance=True).count()
-        total_wins = sum(r.wins for r in rankings)
-        total_losses = sum(r.losses for r in rankings)
-        total_ties = sum(r.ties for r in rankings)
-        best_rank = rankings.aggregate(Min('rank'))['rank__min'] or 0
-        worst_rank = rankings.aggregate(Max('rank'))['rank__max'] or 0
-        
-        # Get highest match score
-        team1_matchups = Matchup.objects.filter(team1=db_team)
-        team2_matchups = Matchup.objects.filter(team2=db_team)
+        # Calculate achievements in a single query
+        stats = rankings.aggregate(
+            championships=Count('id', filter=Q(championship=True)),
+            playoff_appearances=Count('id', filter=Q(playoff_appearance=True)),
+            total_wins=Sum('wins'),
+            total_losses=Sum('losses'),
+            total_ties=Sum('ties'),
+            best_rank=Min('rank'),
+            worst_rank=Max('rank'),
+        )
         
-        highest_match_score = None
-        highest_match = None
+        # All of this team's matchups, whichever side it played on
+        matchups = Matchup.objects.filter(Q(team1=db_team) | Q(team2=db_team)).select_related('team1', 'team2').only(
+            'season', 'week', 'team1', 'team2', 'team1_score', 'team2_score',
+            'team1__team_name', 'team2__team_name',
+        )
         
-        for matchup in team1_matchups:
-            if matchup.team1_score > (highest_match_score or 0):
-                highest_match_score = matchup.team1_score
-                highest_match = matchup
-        
-        for matchup in team2_matchups:
-            if matchup.team2_score > (highest_match_score or 0):
-                highest_match_score = matchup.team2_score
-                highest_match = matchup
+        # Get highest match score (ties go to the most recent match)
+        highest_match = matchups.annotate(
+            score=Case(When(team1=db_team, then=F('team1_score')), default=F('team2_score'))
+        ).filter(score__gt=0).order_by('-score', '-season', '-week').first()
+        highest_match_score = highest_match.score if highest_match else None
         
         # Get highest individual player score
         highest_player_score = PlayerScore.objects.filter(
             team=db_team
+        ).select_related('matchup').only(
+            'player_name', 'fantasy_points', 'matchup', 'matchup__season', 'matchup__week',
         ).order_by('-fantasy_points').first()
         
         # Get all matchups for this team
-        all_matchups = (team1_matchups | team2_matchups).order_by('-season', '-week')[:10]
+        all_matchups = matchups.order_by('-season', '-week')[:10]
         
         context = {
             'team': db_team,
             'team_name': db_team.team_name,
-            'rankings': rankings,
-            'championships': championships,
-            'playoff_appearances': playoff_appearances,
-            'total_wins': total_wins,
-            'total_losses': total_losses,
-            'total_ties': total_ties,
-            'best_rank': best_rank,
-            'worst_rank': worst_rank,
+            # Totals above cover every season, the table only the most recent ones
+            'rankings': rankings[:SEASONS_PER_PAGE],
+            'championships': stats['championships'],
+            'playoff_appearances': stats['playoff_appearances'],
+            'total_wins': stats['total_wins'] or 0,
+            'total_losses': stats['total_losses'] or 0,
+            'total_ties': stats['total_ties'] or 0,
+            'best_rank': stats['best_rank'] or 0,
+            'worst_rank': stats['worst_rank'] or 0,
             'highest_match': highest_match,
             'highest_match_score': highest_match_score,
             'highest_player_score': highest_player_score,
@@ -306,27 +284,12 @@ def team_insights(request, team_id):
     """Team insights page for historic data analysis"""
     team = get_object_or_404(Teams, pk=team_id)
     
-    # Get all rankings
-    rankings = TeamRanking.objects.filter(team=team).order_by('season')
-    
-    # Get all matchups
-    team1_matchups = Matchup.objects.filter(team1=team)
-    team2_matchups = Matchup.objects.filter(team2=team)
-    all_matchups = (team1_matchups | team2_matchups).order_by('season', 'week')
-    
-    # Calculate season-by-season performance
-    season_performance = []
-    for ranking in rankings:
-        season_performance.append({
-            'season': ranking.season,
-            'rank': ranking.rank,
-            'wins': ranking.wins,
-            'losses': ranking.losses,
-            'total_points': ranking.total_points,
-            'average_points': ranking.average_points,
-            'playoff': ranking.playoff_appearance,
-            'championship': ranking.championship,
-        })
+    # Season-by-season performance, read straight from the rankings as dicts, one page at a time
+    rankings = TeamRanking.objects.filter(team=team).values(
+        'season', 'rank', 'wins', 'losses', 'total_points',
+        'average_points', 'championship', playoff=F('playoff_appearance'),
+    ).order_by('season')
+    page_obj = Paginator(rankings, SEASONS_PER_PAGE).get_page(request.GET.get('page'))
     
     # Get top players for this team
     top_players = PlayerScore.objects.filter(team=team).values(
@@ -339,7 +302,8 @@ def team_insights(request, team_id):
     
     context = {
         'team': team,
-        'season_performance': season_performance,
+        'season_performance': page_obj.object_list,
+        'page_obj': page_obj,
         'top_players': top_players,
     }
     return render(request, 'fantasyleague/team_insights.html', context)
\ No newline at end of file
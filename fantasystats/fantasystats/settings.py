@@ -50,6 +50,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "fantasyleague.middleware.SleeperRequestCacheMiddleware",
 ]
 
 ROOT_URLCONF = "fantasystats.urls"
@@ -124,15 +125,36 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 # Sleeper League Configuration
 SLEEPER_LEAGUE_ID = config('SLEEPER_LEAGUE_ID', default='', cast=str)
 SLEEPER_PLAYERS_CACHE_TTL = config('SLEEPER_PLAYERS_CACHE_TTL', default=86400, cast=int)  # 24 hours
+SLEEPER_LEAGUE_CACHE_TTL = config('SLEEPER_LEAGUE_CACHE_TTL', default=60, cast=int)  # 1 minute
 
 # Cache configuration
 # https://docs.djangoproject.com/en/4.2/topics/cache/
+# LocMemCache is per process; use a shared backend (e.g. Redis) when running several workers
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
+# Logging
+# https://docs.djangoproject.com/en/4.2/topics/logging/
+# Set LOG_LEVEL=DEBUG to see the Sleeper API debug output
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'fantasyleague': {
+            'handlers': ['console'],
+            'level': config('LOG_LEVEL', default='INFO'),
+        },
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 